@@ -5,12 +5,28 @@ import time
 from colour_segmentation.base.algorithms.fuzzy_set_segmentator import FuzzySetSegmentator
 from colour_segmentation.base.exceptions.fuzzy_palette_invalid_representation import FuzzyPaletteInvalidRepresentation
 from colour_segmentation.base.segmentation_result import SegmentationResult
-from typing import Dict
+from typing import Dict, Iterable, Iterator
+
+
+# Breakpoints (a, b, c, d) of the trapezoidal membership function of each fuzzy set, in degrees. The red fuzzy set
+# wraps around 0, so its breakpoints are given in the range centred at 0.
+_TRAPEZOIDS = numpy.array([[-25, -10, 10, 20],  # red
+                           [10, 20, 30, 35],  # brown
+                           [30, 34, 42, 50],  # orange
+                           [44, 50, 70, 100],  # yellow
+                           [70, 100, 140, 160],  # green
+                           [140, 160, 200, 220],  # cyan
+                           [200, 220, 260, 290],  # blue
+                           [260, 290, 310, 320],  # purple
+                           [310, 315, 335, 350]], dtype=numpy.float32)  # pink
+
+# Class of each hue value returned by OpenCV for 8-bit images.
+_HUE_TO_CLASS = FuzzySetSegmentator.build_hue_lookup_table(trapezoids=_TRAPEZOIDS)
 
 
 class AmanteTrapezoidalSegmentator(FuzzySetSegmentator):
 
-    def __init__(self, image: numpy.ndarray, labels_representation: Dict = None):
+    def __init__(self, image: numpy.ndarray, labels_representation: Dict = None, hsv_image: numpy.ndarray = None):
         """
         Initializes the object that segments a given image with the Amante-Fonseca fuzzy sets.
 
@@ -19,6 +35,9 @@ class AmanteTrapezoidalSegmentator(FuzzySetSegmentator):
                    range and the channels are BGR.
             labels_representation: A dictionary, representing the palette of colours associated to the Amante-Fonseca
                                    fuzzy sets.
+            hsv_image: A three-dimensional numpy array, representing the image in the HSV colour space as returned by
+                       OpenCV for 8-bit images. It must have the same shape as the image. If None, it is computed from
+                       the image when it is needed.
         """
         if not labels_representation:
             labels_representation = {0: numpy.array([255, 33, 36]),
@@ -35,7 +54,8 @@ class AmanteTrapezoidalSegmentator(FuzzySetSegmentator):
             raise FuzzyPaletteInvalidRepresentation(provided_labels=len(labels_representation.keys()), needed_labels=9)
 
         super(AmanteTrapezoidalSegmentator, self).__init__(image=image,
-                                                           class_representation=labels_representation)
+                                                           class_representation=labels_representation,
+                                                           hsv_image=hsv_image)
 
     def segment(self, remove_achromatic_colours: bool = True) -> SegmentationResult:
         """
@@ -54,227 +74,71 @@ class AmanteTrapezoidalSegmentator(FuzzySetSegmentator):
         Returns:
             A SegmentationResult object, containing the classification of each pixel and the elapsed time.
         """
-        elapsed_time = time.time()
-
-        hsv_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV)
-        h_channel = 2 * (hsv_image[:, :, 0].astype(float))
-
-        red_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_red,
-                                         otypes=[numpy.float])(h_channel)
-        brown_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_brown,
-                                           otypes=[numpy.float])(h_channel)
-        orange_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_orange,
-                                            otypes=[numpy.float])(h_channel)
-        yellow_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_yellow,
-                                            otypes=[numpy.float])(h_channel)
-        green_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_green,
-                                           otypes=[numpy.float])(h_channel)
-        cyan_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_cyan,
-                                          otypes=[numpy.float])(h_channel)
-        blue_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_blue,
-                                          otypes=[numpy.float])(h_channel)
-        purple_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_purple,
-                                            otypes=[numpy.float])(h_channel)
-        pink_membership = numpy.vectorize(AmanteTrapezoidalSegmentator.__fuzzy_trapezoidal_pink,
-                                          otypes=[numpy.float])(h_channel)
-
-        memberships = numpy.stack([red_membership, brown_membership, orange_membership, yellow_membership,
-                                   green_membership, cyan_membership, blue_membership,
-                                   purple_membership, pink_membership], axis=2)
-        colour_classes = memberships.argmax(axis=2)
-        segmentation = self.draw_class_segmentation(classification=colour_classes)
-
-        if remove_achromatic_colours:
-            s_channel = (hsv_image[:, :, 1].astype(float)) / 255
-            v_channel = (hsv_image[:, :, 2].astype(float)) / 255
+        start_time = time.perf_counter()
 
-            segmentation, colour_classes = self.draw_achromatic_classes(s_channel=s_channel,
-                                                                        v_channel=v_channel,
-                                                                        chromatic_segmentation=segmentation,
-                                                                        colour_classes_segmentation=colour_classes)
+        hsv_image = self.hsv_image
 
-        elapsed_time = elapsed_time - time.time()
+        return self.__segment_hsv(hsv_image=hsv_image, remove_achromatic_colours=remove_achromatic_colours,
+                                  start_time=start_time)
 
-        return SegmentationResult(segmented_image=segmentation,
-                                  segmented_classes=colour_classes,
-                                  elapsed_time=elapsed_time)
-
-    @staticmethod
-    def __fuzzy_trapezoidal_red(h: float) -> float:
+    @classmethod
+    def segment_many(cls, images: Iterable[numpy.ndarray], labels_representation: Dict = None,
+                     remove_achromatic_colours: bool = True) -> Iterator[SegmentationResult]:
         """
-        Computes the membership function of the hue value of the red fuzzy set.
+        Segments a sequence of images using the Amante-Fonseca's membership functions, such as the frames of a video.
+        The segmentator and its palette are built once, and the buffer of the HSV conversion is allocated once and
+        reused while consecutive images have the same shape.
 
         Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 < h <= 10 or 350 < h <= 360:
-            return 1
-        elif 10 <= h <= 20:
-            return 2 - h / 10
-        elif 335 <= h <= 350:
-            return -335 / 15 + h / 15
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_brown(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the brown fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 10 < h <= 20:
-            return h / 10 - 1
-        elif 20 <= h <= 30:
-            return 1
-        elif 30 <= h <= 35:
-            return -h / 5 + 7
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_orange(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the orange fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 30 <= h <= 34:
-            return h / 4 - 15 / 2
-        elif 34 <= h <= 42:
-            return 1
-        elif 42 <= h <= 50:
-            return -0.13 * h + 6.25
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_yellow(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the yellow fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 44 <= h <= 50:
-            return 0.17 * h - 7.33
-        elif 50 <= h <= 70:
-            return 1
-        elif 70 <= h <= 100:
-            return -0.03 * h + 3.33
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_green(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the green fuzzy set.
-
-        Args:
-            h: The hue value.
+            images: An iterable of three-dimensional numpy arrays, representing the images to be segmented which
+                    entries are in 0...255 range and the channels are BGR.
+            labels_representation: A dictionary, representing the palette of colours associated to the Amante-Fonseca
+                                   fuzzy sets.
+            remove_achromatic_colours: A boolean, indicating if the achromatic colours have to be removed in the image.
 
         Returns:
-            A float, representing the value of the membership function.
+            An iterator of SegmentationResult objects, one for each image and in the same order.
         """
-        if 70 <= h <= 100:
-            return 0.03 * h - 2.33
-        elif 100 <= h <= 140:
-            return 1
-        elif 140 <= h <= 160:
-            return -0.05 * h + 8
-        else:
-            return 0.0
+        segmentator = None
+        hsv_image = None
+        for image in images:
+            start_time = time.perf_counter()
 
-    @staticmethod
-    def __fuzzy_trapezoidal_cyan(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the cyan fuzzy set.
+            if segmentator is None:
+                segmentator = cls(image=image, labels_representation=labels_representation)
+            else:
+                segmentator.image = image
 
-        Args:
-            h: The hue value.
+            if hsv_image is None or hsv_image.shape != image.shape:
+                hsv_image = numpy.empty_like(image)
+            cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=hsv_image)
 
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 140 <= h <= 160:
-            return 0.05 * h - 7
-        elif 160 <= h <= 200:
-            return 1
-        elif 200 <= h <= 220:
-            return -0.05 * h + 11
-        else:
-            return 0.0
+            yield segmentator.__segment_hsv(hsv_image=hsv_image, remove_achromatic_colours=remove_achromatic_colours,
+                                            start_time=start_time)
 
-    @staticmethod
-    def __fuzzy_trapezoidal_blue(h: float) -> float:
+    def __segment_hsv(self, hsv_image: numpy.ndarray, remove_achromatic_colours: bool,
+                      start_time: float) -> SegmentationResult:
         """
-        Computes the membership function of the hue value of the blue fuzzy set.
+        Segments the image from its representation in the HSV colour space, as returned by OpenCV for 8-bit images.
 
         Args:
-            h: The hue value.
+            hsv_image: A three-dimensional numpy array, representing the image in the HSV colour space.
+            remove_achromatic_colours: A boolean, indicating if the achromatic colours have to be removed in the image.
+            start_time: A float, representing the instant in which the segmentation started.
 
         Returns:
-            A float, representing the value of the membership function.
-        """
-        if 200 <= h <= 220:
-            return 0.05 * h - 10
-        elif 220 <= h <= 260:
-            return 1
-        elif 260 <= h <= 290:
-            return -0.03 * h + 9.67
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_purple(h: float) -> float:
+            A SegmentationResult object, containing the classification of each pixel and the elapsed time.
         """
-        Computes the membership function of the hue value of the purple fuzzy set.
-
-        Args:
-            h: The hue value.
+        colour_classes = cv2.LUT(hsv_image[:, :, 0], _HUE_TO_CLASS)
 
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 260 <= h <= 290:
-            return 0.03 * h - 8.67
-        elif 290 <= h <= 310:
-            return 1
-        elif 310 <= h <= 320:
-            return -h / 10 + 32
-        else:
-            return 0.0
+        if remove_achromatic_colours:
+            colour_classes = self.label_achromatic_classes(s_channel=hsv_image[:, :, 1], v_channel=hsv_image[:, :, 2],
+                                                           colour_classes=colour_classes)
 
-    @staticmethod
-    def __fuzzy_trapezoidal_pink(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the pink fuzzy set.
+        segmentation = self.draw_class_segmentation(classification=colour_classes)
 
-        Args:
-            h: The hue value.
+        elapsed_time = time.perf_counter() - start_time
 
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 310 <= h <= 315:
-            return h / 5 - 62
-        elif 315 <= h <= 335:
-            return 1
-        elif 335 <= h <= 350:
-            return -0.07 * h + 23.33
-        else:
-            return 0.0
+        return SegmentationResult(segmented_image=segmentation,
+                                  segmented_classes=colour_classes,
+                                  elapsed_time=elapsed_time)
@@ -8,9 +8,28 @@ from colour_segmentation.base.segmentation_result import SegmentationResult
 from typing import Dict
 
 
+# Breakpoints (a, b, c, d) of the trapezoidal membership function of each fuzzy set, in degrees. The red fuzzy set
+# wraps around 0, so its breakpoints are given in the range centred at 0.
+_TRAPEZOIDS = numpy.array([[-20, -10, 10, 20],  # red
+                           [10, 20, 40, 50],  # orange
+                           [40, 50, 70, 80],  # yellow
+                           [70, 80, 100, 110],  # yellowgreen
+                           [100, 110, 130, 140],  # green
+                           [130, 140, 160, 170],  # greencyan
+                           [160, 170, 190, 200],  # cyan
+                           [190, 200, 220, 230],  # cyanblue
+                           [220, 230, 250, 260],  # blue
+                           [250, 260, 280, 290],  # bluemagenta
+                           [280, 290, 310, 320],  # magenta
+                           [310, 320, 340, 350]], dtype=numpy.float32)  # magentared
+
+# Class of each hue value returned by OpenCV for 8-bit images.
+_HUE_TO_CLASS = FuzzySetSegmentator.build_hue_lookup_table(trapezoids=_TRAPEZOIDS)
+
+
 class ChamorroTrapezoidalSegmentator(FuzzySetSegmentator):
 
-    def __init__(self, image: numpy.ndarray, labels_representation: Dict = None):
+    def __init__(self, image: numpy.ndarray, labels_representation: Dict = None, hsv_image: numpy.ndarray = None):
         """
         Initializes the object that segments a given image with the Amante-Fonseca fuzzy sets.
 
@@ -19,6 +38,9 @@ class ChamorroTrapezoidalSegmentator(FuzzySetSegmentator):
                    range and the channels are BGR.
             labels_representation: A dictionary, representing the palette of colours associated to the Amante-Fonseca
                                    fuzzy sets.
+            hsv_image: A three-dimensional numpy array, representing the image in the HSV colour space as returned by
+                       OpenCV for 8-bit images. It must have the same shape as the image. If None, it is computed from
+                       the image when it is needed.
         """
         if not labels_representation:
             labels_representation = {0: numpy.array([255, 33, 36]),
@@ -38,7 +60,8 @@ class ChamorroTrapezoidalSegmentator(FuzzySetSegmentator):
             raise FuzzyPaletteInvalidRepresentation(provided_labels=len(labels_representation.keys()), needed_labels=12)
 
         super(ChamorroTrapezoidalSegmentator, self).__init__(image=image,
-                                                             class_representation=labels_representation)
+                                                             class_representation=labels_representation,
+                                                             hsv_image=hsv_image)
 
     def segment(self, remove_achromatic_colours: bool = True) -> SegmentationResult:
         """
@@ -55,294 +78,19 @@ class ChamorroTrapezoidalSegmentator(FuzzySetSegmentator):
         Returns:
             A SegmentationResult object, containing the classification of each pixel and the elapsed time.
         """
-        elapsed_time = time.time()
-
-        hsv_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV)
-        h_channel = 2 * (hsv_image[:, :, 0].astype(float))
+        start_time = time.perf_counter()
 
-        red_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_red,
-                                         otypes=[numpy.float])(h_channel)
-        orange_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_orange,
-                                            otypes=[numpy.float])(h_channel)
-        yellow_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_yellow,
-                                            otypes=[numpy.float])(h_channel)
-        yellowgreen_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_yellowgreen,
-                                                 otypes=[numpy.float])(h_channel)
-        green_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_green,
-                                           otypes=[numpy.float])(h_channel)
-        greencyan_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_greencyan,
-                                               otypes=[numpy.float])(h_channel)
-        cyan_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_cyan,
-                                          otypes=[numpy.float])(h_channel)
-        cyanblue_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_cyanblue,
-                                              otypes=[numpy.float])(h_channel)
-        blue_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_blue,
-                                          otypes=[numpy.float])(h_channel)
-        bluemagenta_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_bluemagenta,
-                                                 otypes=[numpy.float])(h_channel)
-        magenta_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_magenta,
-                                             otypes=[numpy.float])(h_channel)
-        magentared_membership = numpy.vectorize(ChamorroTrapezoidalSegmentator.__fuzzy_trapezoidal_magentared,
-                                                otypes=[numpy.float])(h_channel)
-
-        memberships = numpy.stack([red_membership, orange_membership, yellow_membership, yellowgreen_membership,
-                                   green_membership, greencyan_membership, cyan_membership, cyanblue_membership,
-                                   blue_membership, bluemagenta_membership, magenta_membership,
-                                   magentared_membership], axis=2)
-        colour_classes = memberships.argmax(axis=2)
-        segmentation = self.draw_class_segmentation(classification=colour_classes)
+        hsv_image = self.hsv_image
+        colour_classes = cv2.LUT(hsv_image[:, :, 0], _HUE_TO_CLASS)
 
         if remove_achromatic_colours:
-            s_channel = (hsv_image[:, :, 1].astype(float)) / 255
-            v_channel = (hsv_image[:, :, 2].astype(float)) / 255
+            colour_classes = self.label_achromatic_classes(s_channel=hsv_image[:, :, 1], v_channel=hsv_image[:, :, 2],
+                                                           colour_classes=colour_classes)
 
-            segmentation, colour_classes = self.draw_achromatic_classes(s_channel=s_channel,
-                                                                        v_channel=v_channel,
-                                                                        chromatic_segmentation=segmentation,
-                                                                        colour_classes_segmentation=colour_classes)
+        segmentation = self.draw_class_segmentation(classification=colour_classes)
 
-        elapsed_time = elapsed_time - time.time()
+        elapsed_time = time.perf_counter() - start_time
 
         return SegmentationResult(segmented_image=segmentation,
                                   segmented_classes=colour_classes,
                                   elapsed_time=elapsed_time)
-
-    @staticmethod
-    def __fuzzy_trapezoidal_red(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the red fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 < h <= 10 or 350 < h <= 360:
-            return 1
-        elif 10 <= h <= 20:
-            return -h / 10 + 2
-        elif 340 <= h <= 350:
-            return h / 10 - 34
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_orange(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the orange fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 10 < h <= 20:
-            return h / 10 - 1
-        elif 20 <= h <= 40:
-            return 1
-        elif 40 <= h <= 50:
-            return -h / 10 + 5
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_yellow(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the yellow fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 40 <= h <= 50:
-            return h / 10 - 4
-        elif 50 <= h <= 70:
-            return 1
-        elif 70 <= h <= 80:
-            return -h / 10 + 8
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_yellowgreen(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the yellow-green fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 70 <= h <= 80:
-            return h / 10 - 7
-        elif 80 <= h <= 100:
-            return 1
-        elif 100 <= h <= 110:
-            return -h / 10 + 11
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_green(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the green fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 100 <= h <= 110:
-            return h / 10 - 10
-        elif 110 <= h <= 130:
-            return 1
-        elif 130 <= h <= 140:
-            return -h / 10 + 14
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_greencyan(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the green-cyan fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 130 <= h <= 140:
-            return h / 10 - 13
-        elif 140 <= h <= 160:
-            return 1
-        elif 160 <= h <= 170:
-            return -h / 10 + 17
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_cyan(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the cyan fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 160 <= h <= 170:
-            return h / 10 - 16
-        elif 170 <= h <= 190:
-            return 1
-        elif 190 <= h <= 200:
-            return -h / 10 + 20
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_cyanblue(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the cyan-blue fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 190 <= h <= 200:
-            return h / 10 - 19
-        elif 200 <= h <= 220:
-            return 1
-        elif 220 <= h <= 230:
-            return -h / 10 + 23
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_blue(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the blue fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 220 <= h <= 230:
-            return h / 10 - 22
-        elif 230 <= h <= 250:
-            return 1
-        elif 250 <= h <= 260:
-            return -h / 10 + 26
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_bluemagenta(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the blue-magenta fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 250 <= h <= 260:
-            return h / 10 - 25
-        elif 260 <= h <= 280:
-            return 1
-        elif 280 <= h <= 290:
-            return -h / 10 + 29
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_magenta(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the magenta fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 280 <= h <= 290:
-            return h / 10 - 28
-        elif 290 <= h <= 310:
-            return 1
-        elif 310 <= h <= 320:
-            return -h / 10 + 32
-        else:
-            return 0.0
-
-    @staticmethod
-    def __fuzzy_trapezoidal_magentared(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the magenta-red fuzzy set.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 310 <= h <= 320:
-            return h / 10 - 31
-        elif 320 <= h <= 340:
-            return 1
-        elif 340 <= h <= 350:
-            return -h / 10 + 35
-        else:
-            return 0.0
@@ -1,4 +1,4 @@
-from skimage import color
+import cv2
 import time
 import numpy
 
@@ -8,6 +8,22 @@ from colour_segmentation.base.segmentation_result import SegmentationResult
 from typing import Dict
 
 
+# Breakpoints (a, b, c, d) of the trapezoidal membership function of each fuzzy set, in degrees. The red fuzzy set
+# wraps around 0, so its breakpoints are given in the range centred at 0.
+_TRAPEZOIDS = numpy.array([[-60, -30, 10, 20],  # red
+                           [10, 20, 40, 55],  # orange
+                           [40, 55, 65, 80],  # yellow
+                           [65, 80, 140, 170],  # green
+                           [140, 170, 200, 210],  # cyan
+                           [200, 210, 250, 270],  # blue
+                           [250, 270, 300, 330]], dtype=numpy.float32)  # purple
+
+# Class of the hue at each multiple of 0.1 degrees (even entries) and inside the interval that follows it (odd entries),
+# evaluated at its midpoint. The membership functions only cross at multiples of 0.1 degrees, so every hue is classified
+# as with the membership functions themselves.
+_HUE_TO_CLASS = FuzzySetSegmentator.classify_hue(h=numpy.arange(7202) / 20, trapezoids=_TRAPEZOIDS)
+
+
 class LiuWangTrapezoidalSegmentator(FuzzySetSegmentator):
 
     def __init__(self, image: numpy.ndarray, labels_representation: Dict = None):
@@ -35,6 +51,11 @@ class LiuWangTrapezoidalSegmentator(FuzzySetSegmentator):
         super(LiuWangTrapezoidalSegmentator, self).__init__(image=image,
                                                             class_representation=labels_representation)
 
+    @FuzzySetSegmentator.image.setter
+    def image(self, image: numpy.ndarray):
+        FuzzySetSegmentator.image.fset(self, image)
+        self.__hsv_images = {}
+
     def segment(self, apply_colour_correction: bool = True,
                 remove_achromatic_colours: bool = True) -> SegmentationResult:
         """
@@ -53,243 +74,72 @@ class LiuWangTrapezoidalSegmentator(FuzzySetSegmentator):
         Returns:
             A SegmentationResult object, containing the classification of each pixel and the elapsed time.
         """
-        elapsed_time = time.time()
+        start_time = time.perf_counter()
 
-        image = self.get_float_image()
-        if apply_colour_correction:
-            image = self.__apply_color_correction()
+        hsv_image = self.__get_hsv_image(apply_colour_correction=apply_colour_correction)
+        h_channel = hsv_image[:, :, 0]
 
-        hsv_image = color.rgb2hsv(image)
-        h_channel = 360 * hsv_image[:, :, 0]
+        s_channel = hsv_image[:, :, 1]
+        v_channel = hsv_image[:, :, 2]
 
-        red_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_red,
-                                         otypes=[numpy.float])(h_channel)
-        orange_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_orange,
-                                            otypes=[numpy.float])(h_channel)
-        yellow_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_yellow,
-                                            otypes=[numpy.float])(h_channel)
-        green_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_green,
-                                           otypes=[numpy.float])(h_channel)
-        cyan_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_cyan,
-                                          otypes=[numpy.float])(h_channel)
-        blue_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_blue,
-                                          otypes=[numpy.float])(h_channel)
-        purple_membership = numpy.vectorize(LiuWangTrapezoidalSegmentator.__fuzzy_trapezoidal_purple,
-                                            otypes=[numpy.float])(h_channel)
-
-        memberships = numpy.stack([red_membership, orange_membership, yellow_membership, green_membership,
-                                   cyan_membership, blue_membership, purple_membership], axis=2)
-        colour_classes = memberships.argmax(axis=2)
-        segmentation = self.draw_class_segmentation(classification=colour_classes)
+        tenths = h_channel * 10
+        steps = numpy.floor(tenths)
+        colour_classes = _HUE_TO_CLASS[2 * steps.astype(numpy.int16) + (tenths > steps)]
 
         if remove_achromatic_colours:
-            s_channel = hsv_image[:, :, 1]
-            v_channel = hsv_image[:, :, 2]
+            colour_classes = self.label_achromatic_classes(s_channel=s_channel, v_channel=v_channel,
+                                                           colour_classes=colour_classes)
 
-            segmentation, colour_classes = self.draw_achromatic_classes(s_channel=s_channel,
-                                                                        v_channel=v_channel,
-                                                                        chromatic_segmentation=segmentation,
-                                                                        colour_classes_segmentation=colour_classes)
-        elapsed_time = elapsed_time - time.time()
+        segmentation = self.draw_class_segmentation(classification=colour_classes)
+        elapsed_time = time.perf_counter() - start_time
 
         return SegmentationResult(segmented_image=segmentation,
                                   segmented_classes=colour_classes,
                                   elapsed_time=elapsed_time)
 
-    def __apply_color_correction(self):
-        """
-        Applies the color correction method, normalizing each color channel of the image. The method computes the
-        mean of each channel, and then computes the mean of the three means. Finally, the normalization is carried out
-        multiplying each channel by the factor K/N, where K is the mean of the three means and N is the mean of each
-        channel.
-
-        By construction, the method may cause overflow, since the scale factor can be greater than 1. In that cases,
-        all the values are set to 1.
-
-        Returns:
-            A numpy array, representing the balanced image.
-        """
-        image = self.get_float_image()
-
-        red_channel = image[:, :, 0]
-        green_channel = image[:, :, 1]
-        blue_channel = image[:, :, 2]
-
-        balance_average = (numpy.mean(red_channel) + numpy.mean(green_channel) + numpy.mean(blue_channel)) / 3
-
-        balanced_red = (balance_average / numpy.mean(red_channel)) * red_channel
-        balanced_red[balanced_red > 1] = 1
-        balanced_green = (balance_average / numpy.mean(green_channel)) * green_channel
-        balanced_green[balanced_green > 1] = 1
-        balanced_blue = (balance_average / numpy.mean(blue_channel)) * blue_channel
-        balanced_blue[balanced_blue > 1] = 1
-
-        return numpy.stack([balanced_red, balanced_green, balanced_blue], axis=2)
-
-    @staticmethod
-    def __fuzzy_trapezoidal_red(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the red fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 10 or 330 < h <= 360:
-            return 1.0
-        elif 10 < h <= 20:
-            return -0.1 * h + 2
-        elif 20 < h <= 300:
-            return 0.0
-        elif 300 < h <= 330:
-            return h / 30 - 10
-
-    @staticmethod
-    def __fuzzy_trapezoidal_orange(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the orange fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
-
-        Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 10 or 55 < h <= 360:
-            return 0.0
-        elif 10 < h <= 20:
-            return 0.1 * h - 1
-        elif 20 < h <= 40:
-            return 1.0
-        elif 40 < h <= 55:
-            return -h / 15 + 11 / 3
-
-    @staticmethod
-    def __fuzzy_trapezoidal_yellow(h: float) -> float:
+    def __get_hsv_image(self, apply_colour_correction: bool) -> numpy.ndarray:
         """
-        Computes the membership function of the hue value of the yellow fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
+        Converts the image, balanced with the Gray World method if required, into the HSV colour space. The hue is
+        given in degrees, and the saturation and value in 0...1 range. The conversion is computed once for each value of
+        apply_colour_correction and reused by the following segmentations, until the image is replaced.
 
         Args:
-            h: The hue value.
-
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 40 or 80 < h <= 360:
-            return 0.0
-        elif 40 < h <= 55:
-            return h / 15 - 8 / 3
-        elif 55 < h <= 65:
-            return 1.0
-        elif 65 < h <= 80:
-            return -h / 15 + 11 / 3
-
-    @staticmethod
-    def __fuzzy_trapezoidal_green(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the green fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
-
-        Args:
-            h: The hue value.
+            apply_colour_correction: A boolean, indicating if the Gray World balance has to be applied to the original
+                                     image.
 
         Returns:
-            A float, representing the value of the membership function.
+            A numpy array, representing the image in the HSV colour space.
         """
-        if 0 <= h <= 65 or 170 < h <= 360:
-            return 0.0
-        elif 65 < h <= 80:
-            return h / 15 - 8 / 3
-        elif 80 < h <= 140:
-            return 1.0
-        elif 140 < h <= 170:
-            return -h / 30 + 17 / 3
+        if apply_colour_correction not in self.__hsv_images:
+            if apply_colour_correction:
+                hsv_image = cv2.cvtColor(self.__apply_color_correction().astype(numpy.float32), cv2.COLOR_RGB2HSV)
+            else:
+                hsv_image = cv2.cvtColor(self.image.astype(numpy.float32) / 255, cv2.COLOR_BGR2HSV)
+            hsv_image.flags.writeable = False
+            self.__hsv_images[apply_colour_correction] = hsv_image
 
-    @staticmethod
-    def __fuzzy_trapezoidal_cyan(h: float) -> float:
-        """
-        Computes the membership function of the hue value of the cyan fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
-
-        Args:
-            h: The hue value.
+        return self.__hsv_images[apply_colour_correction]
 
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 140 or 210 < h <= 360:
-            return 0.0
-        elif 140 < h <= 170:
-            return h / 30 - 14 / 3
-        elif 170 < h <= 200:
-            return 1.0
-        elif 200 < h <= 210:
-            return -h / 10 + 21
-
-    @staticmethod
-    def __fuzzy_trapezoidal_blue(h: float) -> float:
+    def __apply_color_correction(self):
         """
-        Computes the membership function of the hue value of the blue fuzzy set.
-
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
+        Applies the color correction method, normalizing each color channel of the image. The method computes the
+        mean of each channel, and then computes the mean of the three means. Finally, the normalization is carried out
+        multiplying each channel by the factor K/N, where K is the mean of the three means and N is the mean of each
+        channel.
 
-        Args:
-            h: The hue value.
+        By construction, the method may cause overflow, since the scale factor can be greater than 1. In that cases,
+        all the values are set to 1. A channel whose mean is 0 is left unchanged.
 
         Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 200 or 270 < h <= 360:
-            return 0.0
-        elif 200 <= h <= 210:
-            return h / 10 - 20
-        elif 210 <= h <= 250:
-            return 1.0
-        elif 250 <= h <= 270:
-            return -h / 20 + 27 / 2
-
-    @staticmethod
-    def __fuzzy_trapezoidal_purple(h: float) -> float:
+            A numpy array, representing the balanced image.
         """
-        Computes the membership function of the hue value of the purple fuzzy set.
+        image = self.get_float_image()
 
-        References:
-            1. Liu C, Wang L. Fuzzy color recognition and segmentation of robot vision scene.
-            Proc - 2015 8th Int Congr Image Signal Process CISP 2015. 2016;(Cisp):448–52.
+        channel_means = image.mean(axis=(0, 1))
+        balance_average = channel_means.mean()
 
-        Args:
-            h: The hue value.
+        balance_factors = numpy.divide(balance_average, channel_means, out=numpy.ones_like(channel_means),
+                                       where=channel_means > 0)
 
-        Returns:
-            A float, representing the value of the membership function.
-        """
-        if 0 <= h <= 250 or 330 < h <= 360:
-            return 0.0
-        elif 250 < h <= 270:
-            return h / 20 - 5 / 4
-        elif 270 < h <= 300:
-            return 1.0
-        elif 300 < h <= 330:
-            return -h / 30 + 11
+        balanced_image = image * balance_factors
+        return numpy.minimum(balanced_image, 1, out=balanced_image)
@@ -1,3 +1,4 @@
+import cv2
 import numpy
 
 from skimage import img_as_float
@@ -8,7 +9,12 @@ from colour_segmentation.base.segmentation_result import SegmentationResult
 
 class FuzzySetSegmentator:
 
-    def __init__(self, image: numpy.ndarray, class_representation: Dict):
+    # Representation colour of the achromatic classes, in the order of the labels -3 (gray), -2 (white) and -1 (black).
+    __ACHROMATIC_REPRESENTATION = numpy.array([[128, 128, 128],
+                                               [255, 255, 255],
+                                               [0, 0, 0]], dtype=numpy.uint8)
+
+    def __init__(self, image: numpy.ndarray, class_representation: Dict, hsv_image: numpy.ndarray = None):
         """
         Initializes the base object for the segmentation using the membership functions of fuzzy sets.
 
@@ -17,10 +23,51 @@ class FuzzySetSegmentator:
                    range and the channels are BGR.
             class_representation: A dictionary with the representation colour of each class. Each entry in the dictionary
                                   must be an integer as the key, and a RGB tuple as value.
+            hsv_image: A three-dimensional numpy array, representing the image in the HSV colour space as returned by
+                       OpenCV for 8-bit images. It must have the same shape as the image. If None, it is computed from
+                       the image when it is needed.
         """
         self.image = image
+        if hsv_image is not None:
+            if hsv_image.shape != image.shape:
+                raise ValueError(f"The HSV image has shape {hsv_image.shape}, but the image has shape {image.shape}.")
+            self.__hsv_image = hsv_image
         self.class_representation = class_representation
 
+        # Palette in BGR as a three-channel table for cv2.LUT. The labels are read as bytes, so the achromatic classes
+        # take the last entries of the table, where their negative labels wrap around. The classes are taken in the
+        # order of their keys.
+        class_colours = [class_representation[class_key] for class_key in sorted(class_representation)]
+
+        self.__palette_lookup_table = numpy.zeros((1, 256, 3), dtype=numpy.uint8)
+        self.__palette_lookup_table[0, :len(class_colours)] = numpy.array(class_colours)[:, ::-1]
+        self.__palette_lookup_table[0, -3:] = FuzzySetSegmentator.__ACHROMATIC_REPRESENTATION[:, ::-1]
+
+    @property
+    def image(self) -> numpy.ndarray:
+        """
+        The image to be segmented, which entries are in 0...255 range and the channels are BGR.
+        """
+        return self.__image
+
+    @image.setter
+    def image(self, image: numpy.ndarray):
+        self.__image = image
+        self.__hsv_image = None
+
+    @property
+    def hsv_image(self) -> numpy.ndarray:
+        """
+        The representation of the image in the HSV colour space, as returned by OpenCV for 8-bit images. The hue is
+        stored in degrees divided by 2, and the saturation and value in 0...255 range. The conversion is computed once
+        and reused by the following segmentations, until the image is replaced.
+        """
+        if self.__hsv_image is None:
+            self.__hsv_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV)
+            self.__hsv_image.flags.writeable = False
+
+        return self.__hsv_image
+
     def segment(self, **kwargs) -> SegmentationResult:
         """
         A generic method to compute the colour segmentation of an RGB image.
@@ -39,7 +86,8 @@ class FuzzySetSegmentator:
 
     def draw_class_segmentation(self, classification: numpy.ndarray) -> numpy.ndarray:
         """
-        Draws the representation color of each class in the corresponding pixel.
+        Draws the representation color of each class in the corresponding pixel. The achromatic classes labeled by
+        label_achromatic_classes are drawn in black, white and gray.
 
         Args:
             classification: A numpy array of integers. Each integer represents the code associated to each class.
@@ -47,94 +95,157 @@ class FuzzySetSegmentator:
         Returns:
             A numpy array, representing the segmented image.
         """
-        segmentation = numpy.zeros_like(self.image)
-        for class_value in self.class_representation.keys():
-            segmentation[classification == class_value] = self.class_representation[class_value]
+        labels = numpy.ascontiguousarray(classification, dtype=numpy.int8).view(numpy.uint8)
 
-        return segmentation[:, :, ::-1]
+        return cv2.LUT(cv2.merge([labels, labels, labels]), self.__palette_lookup_table)
 
     @staticmethod
-    def draw_achromatic_classes(s_channel: numpy.ndarray, v_channel: numpy.ndarray,
-                                chromatic_segmentation: numpy.ndarray,
-                                colour_classes_segmentation: numpy.ndarray):
+    def trapezoidal_membership(h: numpy.ndarray, a: float, b: float, c: float, d: float) -> numpy.ndarray:
         """
-        Draws over the segmented image the achromatic colours. The definition of achromatic colours is given in Amante
-        et al.
-
-        References:
-            Amante JC & Fonseca MJ (2012)
-            Fuzzy Color Space Segmentation to Identify the Same Dominant Colors as Users.
-            18th International Conference on Distributed Multimedia Systems.
+        Computes the membership function of a trapezoidal fuzzy set over an array of hue values. The membership grows
+        linearly from 0 to 1 in [a, b], is 1 in [b, c] and decreases linearly from 1 to 0 in [c, d]. The evaluation is
+        branchless, and a == b or c == d describe a fuzzy set with a sharp edge.
 
         Args:
-            s_channel: A two-dimensional numpy array, representing the saturation channel of the HSV colour space.
-            v_channel: A two-dimensional numpy array, representing the intensity channel of the HSV colour space.
-            chromatic_segmentation: A three-dimensional numpy array, representing the chromatic segmentation.
-            colour_classes_segmentation: A two-dimensional numpy array, representing the class label of the chromatic
-                                         segmentation.
+            h: A numpy array, representing the hue values.
+            a: A float, representing the lower bound of the support of the fuzzy set.
+            b: A float, representing the lower bound of the kernel of the fuzzy set.
+            c: A float, representing the upper bound of the kernel of the fuzzy set.
+            d: A float, representing the upper bound of the support of the fuzzy set.
 
         Returns:
-            A three-dimensional numpy array, representing the chromatic segmentation including the achromatic colours.
+            A numpy array with the same shape as h, representing the value of the membership function.
         """
-        chr_segm = chromatic_segmentation.copy()
-        classes = colour_classes_segmentation.copy()
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            rising = (h - a) / (b - a)
+            falling = (d - h) / (d - c)
+
+            return numpy.clip(numpy.fmin(rising, falling), 0, 1)
+
+    @staticmethod
+    def classify_hue(h: numpy.ndarray, trapezoids: numpy.ndarray) -> numpy.ndarray:
+        """
+        Classifies an array of hue values into the trapezoidal fuzzy set with the highest membership. The memberships
+        are reduced as they are computed, so only the best membership and its class are kept in memory. Ties are
+        resolved in favour of the fuzzy set that appears first in the table.
+
+        Args:
+            h: A numpy array, representing the hue values in degrees.
+            trapezoids: A two-dimensional numpy array with a row (a, b, c, d) for each fuzzy set, representing the
+                        breakpoints of its membership function. A fuzzy set that wraps around 0 is given with a < 0.
 
-        black_pixels = FuzzySetSegmentator.__get_black_pixels(v_channel)
-        gray_pixels = FuzzySetSegmentator.__get_gray_pixels(s_channel, v_channel)
-        white_pixels = FuzzySetSegmentator.__get_white_pixels(s_channel, v_channel)
+        Returns:
+            A numpy array of integers with the same shape as h, representing the class of each hue value.
+        """
+        h = h.astype(numpy.float32, copy=False)
+        wrapped_h = numpy.where(h > 180, h - 360, h)
 
-        chr_segm[black_pixels, :] = [0, 0, 0]
-        classes[black_pixels] = -1
-        chr_segm[white_pixels, :] = [255, 255, 255]
-        classes[white_pixels] = -2
-        chr_segm[gray_pixels, :] = [128, 128, 128]
-        classes[gray_pixels] = -3
+        best_membership = numpy.full(h.shape, -1, dtype=numpy.float32)
+        colour_classes = numpy.zeros(h.shape, dtype=numpy.int8)
+        for i, (a, b, c, d) in enumerate(trapezoids):
+            membership = FuzzySetSegmentator.trapezoidal_membership(h=wrapped_h if a < 0 else h, a=a, b=b, c=c, d=d)
+            improved = membership > best_membership
+            numpy.copyto(best_membership, membership, where=improved)
+            numpy.copyto(colour_classes, i, where=improved)
 
-        return chr_segm, classes
+        return colour_classes
 
     @staticmethod
-    def __get_white_pixels(s_channel: numpy.ndarray, v_channel: numpy.ndarray) -> numpy.ndarray:
+    def build_hue_lookup_table(trapezoids: numpy.ndarray) -> numpy.ndarray:
         """
-        Calculates the mask for pixels that are marked as white. To do this, check which pixels have a value of V
-        greater than 0.81 and a value of S less than 0.14.
+        Builds the table with the class of each hue value returned by OpenCV for 8-bit images, which stores the hue in
+        degrees divided by 2. The table is padded to the 256 entries required by cv2.LUT, although the hue never
+        exceeds 179.
 
         Args:
-            s_channel: A numpy array, representing the matrix of the saturation.
-            v_channel: A numpy array, representing the matrix of the values.
+            trapezoids: A two-dimensional numpy array with a row (a, b, c, d) for each fuzzy set, representing the
+                        breakpoints of its membership function.
 
         Returns:
-            A numpy array of booleans, marking with 1 if the pixel is white, or with 0 in other case.
+            A numpy array of 256 integers, representing the class of each 8-bit hue value.
         """
-        return numpy.logical_and(v_channel > 0.81, s_channel <= 0.14)
+        hue_lookup_table = numpy.zeros(256, dtype=numpy.int8)
+        hue_lookup_table[:180] = FuzzySetSegmentator.classify_hue(h=2 * numpy.arange(180), trapezoids=trapezoids)
+
+        return hue_lookup_table
 
     @staticmethod
-    def __get_black_pixels(v_channel: numpy.ndarray) -> numpy.ndarray:
+    def label_achromatic_classes(s_channel: numpy.ndarray, v_channel: numpy.ndarray,
+                                 colour_classes: numpy.ndarray) -> numpy.ndarray:
         """
-        Calculates the mask for pixels that are marked as black. To do this, check which pixels have a value of V
-        less than 0.19.
+        Labels the achromatic colours over the chromatic classification. The black pixels, with V less than 0.19, are
+        labeled as -1. The remaining pixels with S less than 0.14 are labeled as -2 if they are white, with V greater
+        than 0.81, and as -3 if they are gray. The definition of achromatic colours is given in Amante et al. The labels
+        are written in place into colour_classes.
+
+        References:
+            Amante JC & Fonseca MJ (2012)
+            Fuzzy Color Space Segmentation to Identify the Same Dominant Colors as Users.
+            18th International Conference on Distributed Multimedia Systems.
 
         Args:
-            v_channel: A numpy array, representing the matrix of the values.
+            s_channel: A two-dimensional numpy array, representing the saturation channel of the HSV colour space in
+                       0...1 range, or in 0...255 range if it is an 8-bit array.
+            v_channel: A two-dimensional numpy array, representing the intensity channel of the HSV colour space in
+                       0...1 range, or in 0...255 range if it is an 8-bit array.
+            colour_classes: A two-dimensional numpy array, representing the class label of the chromatic
+                            segmentation. It is overwritten with the achromatic labels.
 
         Returns:
-            A numpy array of booleans, marking with 1 if the pixel is black, or with 0 in other case.
+            A two-dimensional numpy array, representing the class label of each pixel including the achromatic colours.
         """
-        return v_channel <= 0.19
+        if s_channel.dtype == numpy.uint8 and v_channel.dtype == numpy.uint8:
+            achromatic_classes = _ACHROMATIC_LOOKUP_TABLE[(v_channel.astype(numpy.uint16) << 8) | s_channel]
+            return numpy.minimum(achromatic_classes, colour_classes, out=colour_classes)
+
+        achromatic_classes = numpy.where(v_channel > 0.81, numpy.int8(-2), numpy.int8(-3))
+
+        numpy.copyto(colour_classes, achromatic_classes, where=s_channel <= 0.14)
+        colour_classes[v_channel <= 0.19] = -1
+
+        return colour_classes
 
     @staticmethod
-    def __get_gray_pixels(s_channel: numpy.ndarray, v_channel: numpy.ndarray) -> numpy.ndarray:
+    def draw_achromatic_classes(s_channel: numpy.ndarray, v_channel: numpy.ndarray,
+                                chromatic_segmentation: numpy.ndarray,
+                                colour_classes_segmentation: numpy.ndarray):
         """
-        Calculates the mask for pixels that are marked as gray. To do this, check which pixels have a value of V
-        less than 0.81 and greather than 0.19, and a value of S less than 0.14.
+        Draws over the segmented image the achromatic colours. The definition of achromatic colours is given in Amante
+        et al. The classes are labeled with label_achromatic_classes, over a copy of the chromatic classes.
+
+        References:
+            Amante JC & Fonseca MJ (2012)
+            Fuzzy Color Space Segmentation to Identify the Same Dominant Colors as Users.
+            18th International Conference on Distributed Multimedia Systems.
 
         Args:
-            s_channel: A numpy array, representing the matrix of the saturation.
-            v_channel: A numpy array, representing the matrix of the values.
+            s_channel: A two-dimensional numpy array, representing the saturation channel of the HSV colour space.
+            v_channel: A two-dimensional numpy array, representing the intensity channel of the HSV colour space.
+            chromatic_segmentation: A three-dimensional numpy array, representing the chromatic segmentation.
+            colour_classes_segmentation: A two-dimensional numpy array, representing the class label of the chromatic
+                                         segmentation.
 
         Returns:
-            A numpy array of booleans, marking with 1 if the pixel is gray, or with 0 in other case.
+            A three-dimensional numpy array, representing the chromatic segmentation including the achromatic colours,
+            and a two-dimensional numpy array, representing the class label of each pixel including the achromatic
+            colours.
         """
-        v1 = v_channel <= 0.81
-        v2 = 0.19 < v_channel
+        colour_classes = FuzzySetSegmentator.label_achromatic_classes(s_channel=s_channel, v_channel=v_channel,
+                                                                      colour_classes=colour_classes_segmentation.copy())
+
+        # The achromatic representation is ordered by label from -3 to -1.
+        achromatic_pixels = colour_classes < 0
+        achromatic_colours = FuzzySetSegmentator.__ACHROMATIC_REPRESENTATION[colour_classes[achromatic_pixels] + 3]
+
+        segmentation = chromatic_segmentation.copy()
+        segmentation[achromatic_pixels] = achromatic_colours
+
+        return segmentation, colour_classes
+
 
-        return numpy.logical_and(numpy.logical_and(v1, v2), s_channel <= 0.14)
+# Achromatic label of each pair of 8-bit intensity and saturation, indexed by 256 * v + s. The chromatic pairs hold the
+# largest int8 value, so that the labels are applied over the chromatic classes with a minimum.
+_ACHROMATIC_LOOKUP_TABLE = FuzzySetSegmentator.label_achromatic_classes(
+    s_channel=numpy.tile(numpy.arange(256, dtype=numpy.float32) / 255, 256),
+    v_channel=numpy.repeat(numpy.arange(256, dtype=numpy.float32) / 255, 256),
+    colour_classes=numpy.full(256 * 256, numpy.iinfo(numpy.int8).max, dtype=numpy.int8))
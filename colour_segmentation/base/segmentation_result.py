@@ -1,5 +1,7 @@
 import numpy
 
+from typing import Dict
+
 
 class SegmentationResult:
     """
@@ -14,9 +16,32 @@ class SegmentationResult:
         self.segmented_classes = segmented_classes
         self.elapsed_time = elapsed_time
 
+    @property
+    def segmented_classes(self) -> numpy.ndarray:
+        """
+        The class label of each pixel. The number of pixels of every class is counted again after the labels are
+        replaced, but not after they are modified in place, so the array must not be modified once it is stored.
+        """
+        return self.__segmented_classes
+
+    @segmented_classes.setter
+    def segmented_classes(self, segmented_classes: numpy.ndarray):
+        # The labels are stored with one byte per pixel whenever they fit, the same as the classes returned by the
+        # segmentation algorithms. The achromatic classes have negative labels, so the labels are signed.
+        wide_labels = segmented_classes.dtype != numpy.int8 and numpy.issubdtype(segmented_classes.dtype, numpy.integer)
+        if segmented_classes.size and wide_labels:
+            label_range = numpy.iinfo(numpy.int8)
+            if label_range.min <= segmented_classes.min() and segmented_classes.max() <= label_range.max:
+                segmented_classes = segmented_classes.astype(numpy.int8)
+
+        self.__segmented_classes = segmented_classes
+        self.__lowest_label = None
+        self.__class_counts = None
+
     def get_colour_proportion(self, colour_label=None):
         """
-        Computes the proportion of pixels in the segmentation with a certain class..
+        Computes the proportion of pixels in the segmentation with a certain class. The number of pixels of every class
+        is counted in a single pass on the first call, and reused by the following ones.
 
         Args:
             colour_label: An integer, representing the label associated to the red colour. If None,
@@ -28,5 +53,34 @@ class SegmentationResult:
         if colour_label is None:
             colour_label = 0
 
-        colour_pixels = self.segmented_classes == colour_label
-        return colour_pixels.sum() / (colour_pixels.shape[0] * colour_pixels.shape[1])
\ No newline at end of file
+        self.__count_classes()
+
+        count_index = colour_label - self.__lowest_label
+        if count_index < 0 or count_index >= len(self.__class_counts):
+            return 0.0
+
+        return self.__class_counts[count_index] / self.segmented_classes.size
+
+    def get_all_proportions(self) -> Dict[int, float]:
+        """
+        Computes the proportion of pixels in the segmentation of every class, with the same single pass over the
+        classes as get_colour_proportion.
+
+        Returns:
+            A dictionary with the label of each class present in the segmentation as the key, and the proportion of
+            pixels whose associated class is that label as value.
+        """
+        self.__count_classes()
+
+        return {label + self.__lowest_label: count / self.segmented_classes.size
+                for label, count in enumerate(self.__class_counts.tolist()) if count > 0}
+
+    def __count_classes(self):
+        """
+        Counts the number of pixels of every class, if they have not been counted yet.
+        """
+        if self.__class_counts is None:
+            # The achromatic classes have negative labels, so the labels are shifted to start at 0 before counting.
+            self.__lowest_label = int(self.segmented_classes.min()) if self.segmented_classes.size else 0
+            class_indices = self.segmented_classes.ravel().astype(numpy.intp) - self.__lowest_label
+            self.__class_counts = numpy.bincount(class_indices)
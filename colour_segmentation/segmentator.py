@@ -1,5 +1,9 @@
+import cv2
 import numpy
 
+from multiprocessing import Pool
+from typing import Dict, List, Sequence
+
 from colour_segmentation.algorithms.fuzzy_sets.amante_trapezoidal_segmentator import AmanteTrapezoidalSegmentator
 from colour_segmentation.algorithms.fuzzy_sets.chamorro_trapezoidal_segmentator import ChamorroTrapezoidalSegmentator
 from colour_segmentation.algorithms.fuzzy_sets.liu_wang_trapezoidal_segmentator import LiuWangTrapezoidalSegmentator
@@ -10,15 +14,35 @@ from colour_segmentation.base.segmentation_result import SegmentationResult
 
 class Segmentator:
 
+    # Segmentator class that implements each method.
+    __SEGMENTATORS = {SegmentationAlgorithm.FUZZY_SET_AMANTE: AmanteTrapezoidalSegmentator,
+                      SegmentationAlgorithm.FUZZY_SET_CHAMORRO: ChamorroTrapezoidalSegmentator,
+                      SegmentationAlgorithm.FUZZY_SET_LIU: LiuWangTrapezoidalSegmentator,
+                      SegmentationAlgorithm.FUZZY_SET_SHAMIR: ShamirTriangularSegmentator}
+
+    # Methods that segment the HSV representation of the image as returned by OpenCV for 8-bit images, which is
+    # computed once and shared among them.
+    __HSV_METHODS = {SegmentationAlgorithm.FUZZY_SET_AMANTE,
+                     SegmentationAlgorithm.FUZZY_SET_CHAMORRO,
+                     SegmentationAlgorithm.FUZZY_SET_SHAMIR}
+
     def __init__(self, image: numpy.ndarray):
         """
         Initializes the object that segments a given image into its main colours.
 
         Args:
             image: A three-dimensional numpy array, representing the image to be segmented, which entries are in 0...255
-                   range and the channels are BGR.
+                   range and the channels are BGR. A read-only copy of the image is kept and shared, together with
+                   its conversion to the HSV colour space, by the segmentations of every method. Hence, they reflect
+                   the image as it was when the object was created, even if the original image is modified later.
         """
-        self.__image = image
+        if image.ndim != 3 or image.shape[2] != 3:
+            raise ValueError(f"The image to be segmented must have three BGR channels and shape (H, W, 3), but it has "
+                             f"shape {image.shape}.")
+
+        self.__image = numpy.array(image, order="C")
+        self.__image.flags.writeable = False
+        self.__hsv_image = None
 
     def segment(self, method: SegmentationAlgorithm, **kwargs) -> SegmentationResult:
         """
@@ -30,39 +54,51 @@ class Segmentator:
         Returns:
             A SegmentationResult object, containing the classification of each pixel and the elapsed time.
         """
-        if method == SegmentationAlgorithm.FUZZY_SET_AMANTE:
-            return self.__segment_with_amante_trapezoidal(**kwargs)
-        elif method == SegmentationAlgorithm.FUZZY_SET_CHAMORRO:
-            return self.__segment_with_chamorro_trapezoidal(**kwargs)
-        elif method == SegmentationAlgorithm.FUZZY_SET_LIU:
-            return self.__segment_with_liu_trapezoidal(**kwargs)
-        elif method == SegmentationAlgorithm.FUZZY_SET_SHAMIR:
-            return self.__segment_with_shamir_triangular(**kwargs)
-
-    def __segment_with_amante_trapezoidal(self, **kwargs) -> SegmentationResult:
-        """
-        Segments the image with the Amante-Fonseca fuzzy sets.
-        """
-        fuzzy_set_amante_segmentator = AmanteTrapezoidalSegmentator(image=self.__image)
-        return fuzzy_set_amante_segmentator.segment(**kwargs)
+        if method in Segmentator.__HSV_METHODS:
+            segmentator = Segmentator.__SEGMENTATORS[method](image=self.__image, hsv_image=self.__get_hsv_image())
+        else:
+            segmentator = Segmentator.__SEGMENTATORS[method](image=self.__image)
 
-    def __segment_with_chamorro_trapezoidal(self, **kwargs) -> SegmentationResult:
-        """
-        Segments the image with the Chamorro et al fuzzy sets.
-        """
-        fuzzy_set_chamorro_segmentator = ChamorroTrapezoidalSegmentator(image=self.__image)
-        return fuzzy_set_chamorro_segmentator.segment(**kwargs)
+        return segmentator.segment(**kwargs)
 
-    def __segment_with_liu_trapezoidal(self, **kwargs) -> SegmentationResult:
+    @staticmethod
+    def segment_batch(images: Sequence[numpy.ndarray], method: SegmentationAlgorithm, n_workers: int = None,
+                      **kwargs) -> List[SegmentationResult]:
         """
-        Segments the image with the Liu-Wang fuzzy sets.
+        Segments a batch of images with the selected method, distributing the images among a pool of processes. The
+        images are independent, so the work scales with the number of workers.
+
+        Args:
+            images: A sequence of three-dimensional numpy arrays, representing the images to be segmented, which
+                    entries are in 0...255 range and the channels are BGR.
+            method: A SegmentationAlgorithm value, representing the method to be used.
+            n_workers: An integer, representing the number of processes. If None, the number of CPUs is used.
+
+        Returns:
+            A list of SegmentationResult objects, one for each image and in the same order.
         """
-        fuzzy_set_liu_segmentator = LiuWangTrapezoidalSegmentator(image=self.__image)
-        return fuzzy_set_liu_segmentator.segment(**kwargs)
+        with Pool(processes=n_workers) as pool:
+            return pool.starmap(_segment_image, [(image, method, kwargs) for image in images])
 
-    def __segment_with_shamir_triangular(self, **kwargs) -> SegmentationResult:
+    def __get_hsv_image(self) -> numpy.ndarray:
         """
-        Segments the image with the Shamir fuzzy sets.
+        Converts the image into the HSV colour space, as returned by OpenCV for 8-bit images. The conversion is computed
+        once and shared by the segmentations of the following methods. It always matches the image, since the stored
+        image is a read-only copy.
+
+        Returns:
+            A numpy array, representing the image in the HSV colour space.
         """
-        fuzzy_set_shamir_segmentator = ShamirTriangularSegmentator(image=self.__image)
-        return fuzzy_set_shamir_segmentator.segment(**kwargs)
+        if self.__hsv_image is None:
+            self.__hsv_image = cv2.cvtColor(self.__image, cv2.COLOR_BGR2HSV)
+            self.__hsv_image.flags.writeable = False
+
+        return self.__hsv_image
+
+
+def _segment_image(image: numpy.ndarray, method: SegmentationAlgorithm, kwargs: Dict) -> SegmentationResult:
+    """
+    Segments a single image with the selected method. It is defined at module level so that it can be sent to the
+    worker processes of Segmentator.segment_batch.
+    """
+    return Segmentator(image=image).segment(method=method, **kwargs)
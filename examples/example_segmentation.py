@@ -1,6 +1,8 @@
 import cv2
 import numpy
 
+from concurrent.futures import ThreadPoolExecutor
+
 from colour_segmentation.base.segmentation_algorithm import SegmentationAlgorithm
 from colour_segmentation.segmentator import Segmentator
 
@@ -15,25 +17,20 @@ if __name__ == "__main__":
 
     segmentator = Segmentator(image=image)
 
-    result_amante_fonseca_chr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_AMANTE,
-                                                    remove_achromatic_colours=True)
-    result_amante_fonseca_achr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_AMANTE,
-                                                     remove_achromatic_colours=False)
-
-    result_liu = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_LIU,
-                                     apply_colour_correction=False,
-                                     remove_achromatic_colours=True)
-    result_liu_corrected = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_LIU,
-                                               apply_colour_correction=True,
-                                               remove_achromatic_colours=True)
-
-    result_chamorro_chr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_CHAMORRO,
-                                              remove_achromatic_colours=True)
-    result_chamorro_achr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_CHAMORRO,
-                                               remove_achromatic_colours=False)
-
-    result_shamir_chr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_SHAMIR,
-                                            remove_achromatic_colours=True)
-    result_shamir_achr = segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_SHAMIR,
-                                             remove_achromatic_colours=False)
-
+    # The segmentations are independent and spend most of their time in OpenCV and numpy, which release the GIL, so
+    # they are run concurrently.
+    jobs = {"amante_fonseca_chr": (SegmentationAlgorithm.FUZZY_SET_AMANTE, {"remove_achromatic_colours": True}),
+            "amante_fonseca_achr": (SegmentationAlgorithm.FUZZY_SET_AMANTE, {"remove_achromatic_colours": False}),
+            "liu": (SegmentationAlgorithm.FUZZY_SET_LIU, {"apply_colour_correction": False,
+                                                          "remove_achromatic_colours": True}),
+            "liu_corrected": (SegmentationAlgorithm.FUZZY_SET_LIU, {"apply_colour_correction": True,
+                                                                    "remove_achromatic_colours": True}),
+            "chamorro_chr": (SegmentationAlgorithm.FUZZY_SET_CHAMORRO, {"remove_achromatic_colours": True}),
+            "chamorro_achr": (SegmentationAlgorithm.FUZZY_SET_CHAMORRO, {"remove_achromatic_colours": False}),
+            "shamir_chr": (SegmentationAlgorithm.FUZZY_SET_SHAMIR, {"remove_achromatic_colours": True}),
+            "shamir_achr": (SegmentationAlgorithm.FUZZY_SET_SHAMIR, {"remove_achromatic_colours": False})}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {name: executor.submit(segmentator.segment, method=method, **kwargs)
+                   for name, (method, kwargs) in jobs.items()}
+        results = {name: future.result() for name, future in futures.items()}
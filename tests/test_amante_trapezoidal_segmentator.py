@@ -0,0 +1,21 @@
+import numpy
+
+from colour_segmentation.algorithms.fuzzy_sets.amante_trapezoidal_segmentator import AmanteTrapezoidalSegmentator
+
+
+def test_segment_many_matches_segment():
+    rng = numpy.random.default_rng(0)
+    shapes = [(12, 16, 3), (12, 16, 3), (9, 7, 3), (12, 16, 3)]
+    images = [rng.integers(0, 256, size=shape, dtype=numpy.uint8) for shape in shapes]
+
+    for remove_achromatic_colours in (True, False):
+        results = list(AmanteTrapezoidalSegmentator.segment_many(images=images,
+                                                                 remove_achromatic_colours=remove_achromatic_colours))
+
+        assert len(results) == len(images)
+        for image, result in zip(images, results):
+            expected = AmanteTrapezoidalSegmentator(image=image).segment(
+                remove_achromatic_colours=remove_achromatic_colours)
+
+            numpy.testing.assert_array_equal(result.segmented_classes, expected.segmented_classes)
+            numpy.testing.assert_array_equal(result.segmented_image, expected.segmented_image)
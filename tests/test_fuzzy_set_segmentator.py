@@ -0,0 +1,19 @@
+import numpy
+
+from colour_segmentation.base.algorithms.fuzzy_set_segmentator import FuzzySetSegmentator
+
+
+def test_draw_achromatic_classes():
+    s_channel = numpy.array([[0.1, 0.1, 0.1, 0.5]])
+    v_channel = numpy.array([[0.1, 0.5, 0.9, 0.5]])
+    chromatic_segmentation = numpy.full((1, 4, 3), 7, dtype=numpy.uint8)
+    colour_classes = numpy.full((1, 4), 2)
+
+    segmentation, achromatic_classes = FuzzySetSegmentator.draw_achromatic_classes(
+        s_channel=s_channel, v_channel=v_channel, chromatic_segmentation=chromatic_segmentation,
+        colour_classes_segmentation=colour_classes)
+
+    numpy.testing.assert_array_equal(achromatic_classes, [[-1, -3, -2, 2]])
+    numpy.testing.assert_array_equal(segmentation, [[[0, 0, 0], [128, 128, 128], [255, 255, 255], [7, 7, 7]]])
+    numpy.testing.assert_array_equal(chromatic_segmentation, 7)
+    numpy.testing.assert_array_equal(colour_classes, 2)
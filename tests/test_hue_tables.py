@@ -0,0 +1,123 @@
+from fractions import Fraction
+
+import numpy
+
+from colour_segmentation.algorithms.fuzzy_sets import amante_trapezoidal_segmentator
+from colour_segmentation.algorithms.fuzzy_sets import chamorro_trapezoidal_segmentator
+from colour_segmentation.algorithms.fuzzy_sets import liu_wang_trapezoidal_segmentator
+from colour_segmentation.algorithms.fuzzy_sets import shamir_triangular_segmentator
+from colour_segmentation.base.algorithms import fuzzy_set_segmentator
+
+
+def exact_membership(h: Fraction, a: int, b: int, c: int, d: int) -> Fraction:
+    """
+    Evaluates a trapezoidal membership function with exact rational arithmetic.
+    """
+    if h < a or h > d:
+        return Fraction(0)
+    if h < b:
+        return (h - a) / (b - a)
+    if h > c:
+        return (d - h) / (d - c)
+    return Fraction(1)
+
+
+def exact_class(h: Fraction, trapezoids: numpy.ndarray) -> int:
+    """
+    Classifies a hue in degrees into the fuzzy set with the highest exact membership, resolving the ties in favour of
+    the fuzzy set that appears first in the table.
+    """
+    memberships = []
+    for a, b, c, d in trapezoids.astype(int).tolist():
+        memberships.append(exact_membership(h - 360 if a < 0 and h > 180 else h, a, b, c, d))
+
+    return memberships.index(max(memberships))
+
+
+def check_8bit_hue_table(module):
+    hue_lookup_table = module._HUE_TO_CLASS
+    trapezoids = getattr(module, "_TRAPEZOIDS", None)
+    if trapezoids is None:
+        trapezoids = module._TRIANGLES
+
+    assert hue_lookup_table.shape == (256,)
+    assert hue_lookup_table.dtype == numpy.int8
+    for hue in range(180):
+        assert hue_lookup_table[hue] == exact_class(Fraction(2 * hue), trapezoids), hue
+
+
+def test_amante_hue_table():
+    check_8bit_hue_table(amante_trapezoidal_segmentator)
+
+
+def test_amante_hue_table_at_corrected_breakpoints():
+    hue_lookup_table = amante_trapezoidal_segmentator._HUE_TO_CLASS
+
+    # Hues whose class changed when the rounded slopes were replaced by the breakpoints of the fuzzy sets.
+    assert hue_lookup_table[46 // 2] == 2
+    assert [hue_lookup_table[hue // 2] for hue in range(86, 96, 2)] == [4, 4, 4, 4, 4]
+    assert [hue_lookup_table[hue // 2] for hue in range(276, 292, 2)] == [7, 7, 7, 7, 7, 7, 7, 7]
+    assert [hue_lookup_table[hue // 2] for hue in range(336, 344, 2)] == [8, 8, 8, 8]
+
+
+def test_chamorro_hue_table():
+    check_8bit_hue_table(chamorro_trapezoidal_segmentator)
+
+
+def test_shamir_hue_table():
+    check_8bit_hue_table(shamir_triangular_segmentator)
+
+
+def test_shamir_hue_table_ties():
+    hue_lookup_table = shamir_triangular_segmentator._HUE_TO_CLASS
+
+    # At 70 and 102 degrees two triangles have the same membership, and the tie goes to the first one.
+    assert hue_lookup_table[70 // 2] == 3
+    assert hue_lookup_table[102 // 2] == 4
+
+
+def test_liu_wang_hue_table():
+    hue_lookup_table = liu_wang_trapezoidal_segmentator._HUE_TO_CLASS
+    trapezoids = liu_wang_trapezoidal_segmentator._TRAPEZOIDS
+
+    # The even entries hold the class at each multiple of 0.1 degrees and the odd entries the class at the midpoint of
+    # the interval that follows it.
+    assert hue_lookup_table.shape == (7202,)
+    for index in range(7202):
+        assert hue_lookup_table[index] == exact_class(Fraction(index, 20), trapezoids), index
+
+
+def test_liu_wang_hue_table_at_corrected_ramps():
+    hue_lookup_table = liu_wang_trapezoidal_segmentator._HUE_TO_CLASS
+
+    # Yellow keeps the hues in (65, 72.5], and blue the hues in (250, 260], until the ramps cross.
+    assert hue_lookup_table[20 * 70] == 2
+    assert hue_lookup_table[20 * 72 + 1] == 2
+    assert hue_lookup_table[20 * 73 + 1] == 3
+    assert hue_lookup_table[20 * 255] == 5
+    assert hue_lookup_table[20 * 259 + 1] == 5
+    assert hue_lookup_table[20 * 261 + 1] == 6
+
+
+def test_liu_wang_hue_table_between_steps():
+    trapezoids = liu_wang_trapezoidal_segmentator._TRAPEZOIDS
+    h_channel = numpy.random.default_rng(0).uniform(0, 360, size=2000).astype(numpy.float32)
+
+    tenths = h_channel * 10
+    steps = numpy.floor(tenths)
+    colour_classes = liu_wang_trapezoidal_segmentator._HUE_TO_CLASS[2 * steps.astype(numpy.int16) + (tenths > steps)]
+
+    for hue, colour_class in zip(h_channel.tolist(), colour_classes.tolist()):
+        assert colour_class == exact_class(Fraction(hue), trapezoids), hue
+
+
+def test_achromatic_lookup_table():
+    s_channel = numpy.tile(numpy.arange(256), 256) / 255
+    v_channel = numpy.repeat(numpy.arange(256), 256) / 255
+
+    expected_classes = numpy.full(256 * 256, numpy.iinfo(numpy.int8).max)
+    expected_classes[numpy.logical_and(v_channel > 0.81, s_channel <= 0.14)] = -2
+    expected_classes[numpy.logical_and(numpy.logical_and(v_channel <= 0.81, 0.19 < v_channel), s_channel <= 0.14)] = -3
+    expected_classes[v_channel <= 0.19] = -1
+
+    numpy.testing.assert_array_equal(fuzzy_set_segmentator._ACHROMATIC_LOOKUP_TABLE, expected_classes)
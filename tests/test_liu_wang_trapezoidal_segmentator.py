@@ -0,0 +1,21 @@
+import numpy
+
+from colour_segmentation.algorithms.fuzzy_sets.liu_wang_trapezoidal_segmentator import LiuWangTrapezoidalSegmentator
+
+
+def test_colour_correction_of_black_image():
+    image = numpy.zeros((8, 10, 3), dtype=numpy.uint8)
+
+    result = LiuWangTrapezoidalSegmentator(image=image).segment(apply_colour_correction=True)
+
+    numpy.testing.assert_array_equal(result.segmented_classes, -1)
+
+
+def test_colour_correction_of_image_with_zero_channel():
+    # A yellow image, whose blue channel is 0. The red and green channels are balanced, and the blue one is kept.
+    image = numpy.zeros((8, 10, 3), dtype=numpy.uint8)
+    image[:, :, 1:] = 200
+
+    result = LiuWangTrapezoidalSegmentator(image=image).segment(apply_colour_correction=True)
+
+    numpy.testing.assert_array_equal(result.segmented_classes, 2)
@@ -0,0 +1,36 @@
+import numpy
+
+from colour_segmentation.base.segmentation_result import SegmentationResult
+
+
+def test_empty_segmentation_result():
+    result = SegmentationResult(segmented_image=numpy.zeros((0, 0, 3), dtype=numpy.uint8),
+                                segmented_classes=numpy.zeros((0, 0), dtype=numpy.int64),
+                                elapsed_time=0.0)
+
+    assert result.get_colour_proportion(0) == 0.0
+    assert result.get_all_proportions() == {}
+
+
+def test_colour_proportions_with_achromatic_classes():
+    result = SegmentationResult(segmented_image=numpy.zeros((2, 2, 3), dtype=numpy.uint8),
+                                segmented_classes=numpy.array([[-3, 1], [1, 5]]),
+                                elapsed_time=0.0)
+
+    assert result.segmented_classes.dtype == numpy.int8
+    assert result.get_colour_proportion(1) == 0.5
+    assert result.get_colour_proportion(2) == 0.0
+    assert result.get_all_proportions() == {-3: 0.25, 1: 0.5, 5: 0.25}
+
+
+def test_colour_proportions_after_replacing_classes():
+    result = SegmentationResult(segmented_image=numpy.zeros((2, 2, 3), dtype=numpy.uint8),
+                                segmented_classes=numpy.array([[0, 0], [0, 1]]),
+                                elapsed_time=0.0)
+    assert result.get_colour_proportion(0) == 0.75
+
+    result.segmented_classes = numpy.array([[1, 1], [1, 0]])
+
+    assert result.segmented_classes.dtype == numpy.int8
+    assert result.get_colour_proportion(0) == 0.25
+    assert result.get_all_proportions() == {0: 0.25, 1: 0.75}
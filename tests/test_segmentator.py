@@ -0,0 +1,53 @@
+import numpy
+import pytest
+
+from colour_segmentation.base.segmentation_algorithm import SegmentationAlgorithm
+from colour_segmentation.segmentator import Segmentator
+
+
+def test_segment_batch_matches_segment():
+    rng = numpy.random.default_rng(0)
+    images = [rng.integers(0, 256, size=shape, dtype=numpy.uint8) for shape in [(12, 16, 3), (9, 7, 3), (5, 5, 3)]]
+
+    cases = [(SegmentationAlgorithm.FUZZY_SET_AMANTE, {"remove_achromatic_colours": False}),
+             (SegmentationAlgorithm.FUZZY_SET_CHAMORRO, {}),
+             (SegmentationAlgorithm.FUZZY_SET_LIU, {"apply_colour_correction": False}),
+             (SegmentationAlgorithm.FUZZY_SET_SHAMIR, {"remove_achromatic_colours": False})]
+    for method, kwargs in cases:
+        results = Segmentator.segment_batch(images=images, method=method, n_workers=2, **kwargs)
+
+        assert len(results) == len(images)
+        for image, result in zip(images, results):
+            expected = Segmentator(image=image).segment(method=method, **kwargs)
+
+            numpy.testing.assert_array_equal(result.segmented_classes, expected.segmented_classes)
+            numpy.testing.assert_array_equal(result.segmented_image, expected.segmented_image)
+
+            # The keyword arguments change the segmentation of these images, so they must have been forwarded.
+            if kwargs:
+                default = Segmentator(image=image).segment(method=method)
+                assert not numpy.array_equal(result.segmented_classes, default.segmented_classes)
+
+
+def test_segmentator_rejects_images_without_three_channels():
+    for shape in [(12, 16), (12, 16, 4)]:
+        with pytest.raises(ValueError, match="image to be segmented"):
+            Segmentator(image=numpy.zeros(shape, dtype=numpy.uint8))
+
+
+def test_segmentator_keeps_the_image_at_construction():
+    rng = numpy.random.default_rng(0)
+    image = rng.integers(0, 256, size=(12, 16, 3), dtype=numpy.uint8)
+    original_image = image.copy()
+
+    segmentator = Segmentator(image=image)
+    segmentator.segment(method=SegmentationAlgorithm.FUZZY_SET_AMANTE)
+
+    assert image.flags.writeable
+    image[:] = 255 - image
+
+    for method in SegmentationAlgorithm:
+        result = segmentator.segment(method=method)
+        expected = Segmentator(image=original_image).segment(method=method)
+
+        numpy.testing.assert_array_equal(result.segmented_classes, expected.segmented_classes)